@@ -38,6 +38,7 @@ from .typingx import (
     MutableSet,
     Optional,
     Tuple,
+    Type,
     Union,
 )
 
@@ -71,10 +72,13 @@ class NodeVisitor:
         3. ``self.generic_visit()``.
 
     This dispatching mechanism is implemented in the main :meth:`visit`
-    method and can be overriden in subclasses. Additionally, a class can
-    define a list of context handlers to be applied before the actual visit
-    to customize the context. Each context receives the visitor instance,
-    the node instance, and the keywords arguments of the call.
+    method and can be overriden in subclasses. The lookup is performed on
+    the visitor class and its result is cached for each node class, so
+    visitor methods should not be added to a class after it has been used.
+    Additionally, a class can define a list of context handlers to be
+    applied before the actual visit to customize the context. Each context
+    receives the visitor instance, the node instance, and the keywords
+    arguments of the call.
 
     Note that return values are not forwarded to the caller in the default
     :meth:`generic_visit` implementation. If you want to return a value from
@@ -114,22 +118,36 @@ class NodeVisitor:
 
     contexts: ClassVar[Optional[Tuple[ContextCallable, ...]]] = None
 
-    def visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
-        visitor = self.generic_visit
-
-        method_name = "visit_" + node.__class__.__name__
-        if hasattr(self, method_name):
-            visitor = getattr(self, method_name)
-        elif isinstance(node, concepts.BaseNode):
-            for node_class in node.__class__.__mro__[1:]:
-                method_name = "visit_" + node_class.__name__
-                if hasattr(self, method_name):
-                    visitor = getattr(self, method_name)
-                    break
+    _visitor_names_: ClassVar[Dict[Type, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._visitor_names_ = {}
+
+    @classmethod
+    def _find_visitor_name(cls, node_class: Type) -> str:
+        method_name = "visit_" + node_class.__name__
+        if hasattr(cls, method_name):
+            return method_name
+        elif issubclass(node_class, concepts.BaseNode):
+            for base_class in node_class.__mro__[1:]:
+                method_name = "visit_" + base_class.__name__
+                if hasattr(cls, method_name):
+                    return method_name
 
-                if node_class is concepts.BaseNode:
+                if base_class is concepts.BaseNode:
                     break
 
+        return "generic_visit"
+
+    def visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
+        # Visitor methods are resolved once per (visitor class, node class) pair
+        visitor_names = type(self)._visitor_names_
+        node_class = node.__class__
+        if (method_name := visitor_names.get(node_class, None)) is None:
+            method_name = visitor_names[node_class] = self._find_visitor_name(node_class)
+        visitor = getattr(self, method_name)
+
         if ctxs := type(self).contexts:
             with contextlib.ExitStack() as stack:
                 for ctx in ctxs:
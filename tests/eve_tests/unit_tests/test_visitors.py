@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+#
+# Eve Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2020, CSCS - Swiss National Supercomputing Center, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+from __future__ import annotations
+
+import eve
+
+from .. import definitions
+
+
+class SimpleVisitor(eve.NodeVisitor):
+    def visit_SimpleNode(self, node, **kwargs):
+        return "SimpleNode"
+
+    def visit_Node(self, node, **kwargs):
+        return "Node"
+
+    def generic_visit(self, node, **kwargs):
+        return "generic"
+
+
+class DerivedVisitor(SimpleVisitor):
+    def visit_EmptyNode(self, node, **kwargs):
+        return "EmptyNode"
+
+
+def test_visitor_dispatch(simple_node, empty_node, compound_node):
+    visitor = SimpleVisitor()
+    for _ in range(2):
+        assert visitor.visit(simple_node) == "SimpleNode"
+        assert visitor.visit(empty_node) == "Node"
+        assert visitor.visit(compound_node) == "Node"
+        assert visitor.visit(1) == "generic"
+
+
+def test_visitor_dispatch_subclass(simple_node, empty_node):
+    assert SimpleVisitor().visit(empty_node) == "Node"
+    assert DerivedVisitor().visit(empty_node) == "EmptyNode"
+    assert DerivedVisitor().visit(simple_node) == "SimpleNode"
+    assert SimpleVisitor().visit(empty_node) == "Node"
+
+    assert definitions.EmptyNode not in eve.NodeVisitor._visitor_names_